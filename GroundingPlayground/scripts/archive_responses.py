@@ -1,24 +1,35 @@
 """
 Archive and organize collected Gemini grounding responses.
 
-Creates a structured archive with:
+Creates a structured ZIP archive with:
 - Organized folders by method
-- Metadata index
-- Extracted summaries
-- Zip package for sharing
+- Metadata index with extracted summaries (index.ndjson + meta.json)
+
+Everything is written straight into the ZIP; nothing is staged on disk.
 
 Usage:
     python archive_responses.py
+    python archive_responses.py --compression lzma --level 9
+    python archive_responses.py --legacy-index
 """
 
 import os
+import re
+import argparse
 import sys
 import json
-import shutil
 import zipfile
+import pandas as pd
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson  # optional: much faster JSON encoding
+except ImportError:
+    orjson = None
+
 sys.path.insert(0, str(Path(__file__).parent))
 from parse_gemini_response import parse_gemini_response
 
@@ -27,49 +38,152 @@ EXPERIMENTS_DIR = PROJECT_ROOT / "experiments"
 RESPONSES_DIR = EXPERIMENTS_DIR / "responses"
 ARCHIVE_DIR = PROJECT_ROOT / "archive"
 OUTPUT_DIR = PROJECT_ROOT / "output"
+PARSE_CACHE_FILE = ARCHIVE_DIR / ".parse_cache.json"
+
+# Fallback heuristic for Method 1 responses not in the query matrix
+METHOD1_PATTERN = re.compile(r'M1_|(?i:gemini)')
+
+# ZIP compression methods selectable from the CLI. DEFLATE is the default
+# because Windows Expand-Archive cannot read BZIP2/LZMA entries.
+COMPRESSION_METHODS = {
+    'deflate': zipfile.ZIP_DEFLATED,
+    'bzip2': zipfile.ZIP_BZIP2,
+    'lzma': zipfile.ZIP_LZMA,
+}
+
+
+def dumps_json(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(data: bytes):
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def load_query_matrix():
-    """Load query metadata."""
-    queries = {}
+    """Load query metadata as namedtuple rows keyed by query_id (last row wins)."""
     matrix_file = EXPERIMENTS_DIR / "query_matrix.tsv"
     
     if not matrix_file.exists():
-        return queries
+        return {}
+    
+    df = pd.read_csv(matrix_file, sep='\t', dtype=str, keep_default_na=False)
+    return {row.query_id: row for row in df.itertuples(index=False, name='QueryRow')}
+
+
+def load_parse_cache():
+    """Load cached parse results from previous runs."""
+    if not PARSE_CACHE_FILE.exists():
+        return {}
+    try:
+        return loads_json(PARSE_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_parse_cache(cache):
+    """Persist parse results for the next run."""
+    PARSE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    PARSE_CACHE_FILE.write_bytes(dumps_json(cache))
+
+
+def parse_cache_key(resp_file):
+    """Cache key for a response file: (absolute path, mtime, size)."""
+    st = resp_file.stat()
+    return f"{resp_file.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _parse_worker(path_str):
+    """Parse one response in a worker process; returns (parsed, error)."""
+    try:
+        return parse_gemini_response(Path(path_str)), None
+    except Exception as e:
+        return None, str(e)
+
+
+def parse_all(resp_files, cache):
+    """
+    Parse response files, reusing cached results for unchanged files.
+    
+    Cache misses are parsed in parallel across processes, unless there are
+    too few of them to pay for starting the pool.
+    
+    Returns:
+        Dict of cache key -> (parsed, error)
+    """
+    results = {}
+    misses = {}
+    for resp_file in resp_files:
+        key = parse_cache_key(resp_file)
+        if key in cache:
+            results[key] = (cache[key], None)
+        else:
+            misses[key] = str(resp_file)
+    
+    if len(misses) < (os.cpu_count() or 1):
+        results.update(zip(misses, map(_parse_worker, misses.values())))
+    else:
+        with ProcessPoolExecutor() as ex:
+            results.update(zip(misses, ex.map(_parse_worker, misses.values())))
+    
+    return results
+
+
+def find_desktop_responses(desktop, exclude):
+    """
+    Find *response*.txt files (any case) on the desktop in one directory scan.
     
-    with open(matrix_file, 'r', encoding='utf-8') as f:
-        headers = f.readline().strip().split('\t')
-        for line in f:
-            values = line.strip().split('\t')
-            row = dict(zip(headers, values))
-            queries[row['query_id']] = row
+    Files whose resolved path is in exclude are skipped.
+    """
+    if not desktop.is_dir():
+        return []
     
-    return queries
+    found = []
+    with os.scandir(desktop) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if not (name.endswith('.txt') and 'response' in name and entry.is_file()):
+                continue
+            path = Path(entry.path)
+            if path.resolve() not in exclude:
+                found.append(path)
+    return found
 
 
-def create_archive():
-    """Create organized archive of all responses."""
+def create_archive(compression: str = 'deflate', level: int = 9, legacy_index: bool = False):
+    """
+    Create organized archive of all responses.
+    
+    Args:
+        compression: One of COMPRESSION_METHODS ('deflate', 'bzip2', 'lzma')
+        level: Compression level (ignored by lzma)
+        legacy_index: Also write the single-object INDEX.json
+    """
     
     print("="*60)
     print("  GEMINI GROUNDING RESPONSE ARCHIVE")
     print("="*60)
     
-    # Create archive structure
+    # Archive name
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     archive_name = f"gemini_grounding_archive_{timestamp}"
-    archive_path = ARCHIVE_DIR / archive_name
+    zip_path = ARCHIVE_DIR / f"{archive_name}.zip"
+    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
     
-    # Method folders
+    # Method folders (inside the ZIP)
     method_dirs = {
-        'method1_variations': archive_path / "01_Query_Variations",
-        'method2_entities': archive_path / "02_Entity_Comparison", 
-        'method3_attributes': archive_path / "03_Attribute_Probing",
-        'other': archive_path / "04_Other"
+        'method1_variations': "01_Query_Variations",
+        'method2_entities': "02_Entity_Comparison", 
+        'method3_attributes': "03_Attribute_Probing",
+        'other': "04_Other"
     }
     
-    for d in method_dirs.values():
-        d.mkdir(parents=True, exist_ok=True)
-    
     # Load query metadata
     query_matrix = load_query_matrix()
     
@@ -78,12 +192,19 @@ def create_archive():
     
     # Also check for responses on Desktop
     desktop = Path(os.path.expanduser("~")) / "OneDrive - Microsoft" / "Desktop"
-    desktop_responses = list(desktop.glob("*Response*.txt")) + list(desktop.glob("*response*.txt"))
+    seen = {p.resolve() for p in response_files}
+    desktop_responses = find_desktop_responses(desktop, seen)
     
     all_responses = response_files + desktop_responses
     
     print(f"\nFound {len(all_responses)} response files")
     
+    # Parse new/changed responses; only entries seen this run are kept
+    parse_results = parse_all(all_responses, load_parse_cache())
+    new_parse_cache = {}
+    method_counts = Counter()
+    index_lines = []
+    
     # Master index
     index = {
         'created': datetime.now().isoformat(),
@@ -92,82 +213,90 @@ def create_archive():
         'responses': []
     }
     
-    # Process each response
-    for resp_file in all_responses:
-        print(f"\n  Processing: {resp_file.name}")
+    # Files are written straight into the ZIP as each response is processed
+    with zipfile.ZipFile(zip_path, 'w', COMPRESSION_METHODS[compression], compresslevel=level) as zf:
+        
+        # Process each response
+        for resp_file in all_responses:
+            print(f"\n  Processing: {resp_file.name}")
         
-        # Determine query ID and method
-        query_id = resp_file.stem.replace("_response", "").replace("Response", "")
+            # Determine query ID and method
+            query_id = resp_file.stem.replace("_response", "").replace("Response", "")
         
-        # Try to match to query matrix
-        query_info = query_matrix.get(query_id, {})
-        method = query_info.get('method', 'other')
+            # Try to match to query matrix
+            query_info = query_matrix.get(query_id)
+            method = getattr(query_info, 'method', 'other')
         
-        # If can't determine from ID, check filename
-        if method == 'other':
-            if 'M1_' in query_id or 'gemini' in resp_file.name.lower():
-                method = 'method1_variations'
+            # If can't determine from ID, check filename
+            if method == 'other':
+                if METHOD1_PATTERN.search(query_id) or METHOD1_PATTERN.search(resp_file.name):
+                    method = 'method1_variations'
         
-        # Parse the response
-        try:
-            parsed = parse_gemini_response(resp_file)
+            # Look up the parse result
+            key = parse_cache_key(resp_file)
+            parsed, error = parse_results[key]
             
-            # Create summary
-            summary = {
-                'query_id': query_id,
-                'original_file': resp_file.name,
-                'method': method,
-                'query_text': query_info.get('query_text', '(unknown)'),
-                'entity': query_info.get('entity', '(unknown)'),
-                'parsed': {
-                    'place_id': parsed['structured'].get('place_id'),
-                    'phone': parsed['structured'].get('phone'),
-                    'rating': parsed['structured'].get('rating'),
-                    'price_range': parsed['structured'].get('price_range'),
-                    'amenities': list(parsed['amenities'].keys()),
-                    'has_review_summary': bool(parsed['semi_structured'].get('review_summary')),
-                    'has_tips': bool(parsed['semi_structured'].get('tips')),
-                    'has_most_ordered': bool(parsed['semi_structured'].get('most_ordered')),
-                    'review_count': parsed['unstructured'].get('review_count', 0),
-                    'photo_count': parsed['unstructured'].get('photo_count', 0)
+            if error is None:
+                new_parse_cache[key] = parsed
+                
+                # Create summary
+                summary = {
+                    'query_id': query_id,
+                    'original_file': resp_file.name,
+                    'method': method,
+                    'query_text': getattr(query_info, 'query_text', '(unknown)'),
+                    'entity': getattr(query_info, 'entity', '(unknown)'),
+                    'parsed': {
+                        'place_id': parsed['structured'].get('place_id'),
+                        'phone': parsed['structured'].get('phone'),
+                        'rating': parsed['structured'].get('rating'),
+                        'price_range': parsed['structured'].get('price_range'),
+                        'amenities': list(parsed['amenities'].keys()),
+                        'has_review_summary': bool(parsed['semi_structured'].get('review_summary')),
+                        'has_tips': bool(parsed['semi_structured'].get('tips')),
+                        'has_most_ordered': bool(parsed['semi_structured'].get('most_ordered')),
+                        'review_count': parsed['unstructured'].get('review_count', 0),
+                        'photo_count': parsed['unstructured'].get('photo_count', 0)
+                    }
                 }
-            }
-            
-        except Exception as e:
-            print(f"    ⚠ Parse error: {e}")
-            summary = {
-                'query_id': query_id,
-                'original_file': resp_file.name,
-                'method': method,
-                'error': str(e)
-            }
-        
-        index['responses'].append(summary)
-        
-        # Copy to appropriate folder
-        dest_dir = method_dirs.get(method, method_dirs['other'])
-        dest_file = dest_dir / f"{query_id}.txt"
-        shutil.copy(resp_file, dest_file)
-        
-        # Write individual summary
-        summary_file = dest_dir / f"{query_id}_summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
-        
-        print(f"    → {dest_dir.name}/{query_id}.txt")
-    
-    # Count by method
-    for method in method_dirs.keys():
-        count = len([r for r in index['responses'] if r.get('method') == method])
-        index['methods'][method] = count
-    
-    # Write master index
-    index_file = archive_path / "INDEX.json"
-    with open(index_file, 'w', encoding='utf-8') as f:
-        json.dump(index, f, indent=2)
-    
-    # Create README
-    readme_content = f"""# Gemini Grounding Response Archive
+            else:
+                print(f"    ⚠ Parse error: {error}")
+                summary = {
+                    'query_id': query_id,
+                    'original_file': resp_file.name,
+                    'method': method,
+                    'error': error
+                }
+        
+            index['responses'].append(summary)
+            index_lines.append(dumps_json(summary))
+            method_counts[method] += 1
+        
+            # Add to appropriate folder
+            dest_dir = method_dirs.get(method, method_dirs['other'])
+            zf.write(resp_file, arcname=f"{dest_dir}/{query_id}.txt")
+        
+            print(f"    → {dest_dir}/{query_id}.txt")
+        
+        # Count by method
+        index['methods'] = {method: method_counts[method] for method in method_dirs}
+        
+        # Write master index: one JSON record per line, totals separately
+        meta = {k: v for k, v in index.items() if k != 'responses'}
+        zf.writestr("index.ndjson", b"".join(line + b"\n" for line in index_lines))
+        zf.writestr("meta.json", dumps_json(meta, indent=True))
+        if legacy_index:
+            zf.writestr("INDEX.json", dumps_json(index, indent=True))
+        
+        index_files = (
+            "- `index.ndjson` - One JSON record per response with metadata and parsed attributes\n"
+            "- `meta.json` - Creation time, total and per-folder counts\n"
+        )
+        if legacy_index:
+            index_files += "- `INDEX.json` - Legacy master index (meta + all responses in one object)\n"
+        
+        # Create README
+        readme_content = f"""# Gemini Grounding Response Archive
 
 Created: {datetime.now().strftime("%Y-%m-%d %H:%M")}
 
@@ -184,43 +313,29 @@ Created: {datetime.now().strftime("%Y-%m-%d %H:%M")}
 
 ## Files
 
-- `INDEX.json` - Master index with all response metadata
-- Each folder contains:
-  - `<query_id>.txt` - Raw DevTools response
-  - `<query_id>_summary.json` - Parsed attributes
+{index_files}- Each folder contains `<query_id>.txt` - Raw DevTools response
 
 ## Amenities Discovered
 
 """
+        
+        # Collect all amenities
+        all_amenities = set()
+        for resp in index['responses']:
+            if 'parsed' in resp:
+                all_amenities.update(resp['parsed'].get('amenities', []))
+        
+        for amenity in sorted(all_amenities):
+            readme_content += f"- {amenity}\n"
+        
+        zf.writestr("README.md", readme_content)
     
-    # Collect all amenities
-    all_amenities = set()
-    for resp in index['responses']:
-        if 'parsed' in resp:
-            all_amenities.update(resp['parsed'].get('amenities', []))
-    
-    for amenity in sorted(all_amenities):
-        readme_content += f"- {amenity}\n"
-    
-    readme_file = archive_path / "README.md"
-    with open(readme_file, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    
-    # Create ZIP
-    zip_path = ARCHIVE_DIR / f"{archive_name}.zip"
-    print(f"\n  Creating ZIP archive...")
-    
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for file_path in archive_path.rglob('*'):
-            if file_path.is_file():
-                arcname = file_path.relative_to(archive_path)
-                zf.write(file_path, arcname)
+    save_parse_cache(new_parse_cache)
     
     print(f"\n{'='*60}")
     print(f"  ARCHIVE COMPLETE")
     print(f"{'='*60}")
-    print(f"\n  📁 Folder: {archive_path}")
-    print(f"  📦 ZIP:    {zip_path}")
+    print(f"\n  📦 ZIP:    {zip_path}")
     print(f"  📊 Total:  {index['total_responses']} responses")
     
     return zip_path
@@ -240,8 +355,17 @@ def list_archive_contents(zip_path):
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Archive Gemini grounding responses')
+    parser.add_argument('--compression', choices=sorted(COMPRESSION_METHODS), default='deflate',
+                        help='ZIP compression method (default: deflate)')
+    parser.add_argument('--level', type=int, default=9,
+                        help='Compression level, 1-9 (default: 9)')
+    parser.add_argument('--legacy-index', action='store_true',
+                        help='Also write the single-object INDEX.json for older tools')
+    args = parser.parse_args()
+    
     # Create the archive
-    zip_path = create_archive()
+    zip_path = create_archive(args.compression, args.level, args.legacy_index)
     
     # Show contents
     if zip_path.exists():
@@ -0,0 +1,12 @@
+"""
+Static asset helpers shared by the page generators (kept free of pandas)
+"""
+
+import re
+
+
+def minify_css(css):
+    """Strip comments and the whitespace around CSS punctuation."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s*([{}:;,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
@@ -4,19 +4,24 @@ Helper script for manually collecting competitive responses.
 This script:
 1. Loads queries that don't have responses yet
 2. Opens each query for you to test
-3. Prompts you to enter responses from each competitor
-4. Saves to responses TSV
+3. Opens a template in $EDITOR to enter responses from each competitor
+4. Saves to responses TSV after every query
 
 Usage:
     python collect_responses.py
     python collect_responses.py --queries my_queries.tsv --output my_responses.tsv
 """
 
+import os
+import shlex
 import argparse
+import subprocess
+import tempfile
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from utils import load_queries, load_responses, save_tsv, PROJECT_ROOT
+from typing import Dict, List, Tuple
+from utils import load_queries, load_responses, append_tsv, PROJECT_ROOT
 
 
 RESPONDERS = ['bing_copilot', 'gemini', 'perplexity']
@@ -26,9 +31,173 @@ ANSWER_OPTIONS = {
     'confidence': ['high', 'medium', 'low'],
 }
 
+TEMPLATE_FIELDS = ['response_text', 'answered', 'confidence', 'source_cited', 'richness_score']
+
+
+def get_editor() -> str:
+    """Editor command from $EDITOR, defaulting to notepad/nano."""
+    return os.environ.get('EDITOR') or ('notepad' if os.name == 'nt' else 'nano')
+
+
+def build_template(query: pd.Series) -> str:
+    """Build the editable template for one query, one block per responder."""
+    lines = [
+        f"# Query {query['query_id']}: {query['query_text']}",
+    ]
+    if 'entity_name' in query and pd.notna(query['entity_name']):
+        lines.append(f"# Entity: {query['entity_name']}")
+    if 'location' in query and pd.notna(query['location']):
+        lines.append(f"# Location: {query['location']}")
+    lines += [
+        "#",
+        "# Fill in each responder block, then save and close the editor.",
+        "# Leave response_text empty to skip a responder.",
+        "# answered: yes/partial/no | confidence: high/medium/low | richness_score: 1-5",
+        "# response_text may continue over several lines (joined with spaces).",
+        "# Set any response_text to quit to save this query and stop the session.",
+    ]
+    for responder in RESPONDERS:
+        lines.append("")
+        lines.append(f"[{responder}]")
+        lines += [f"{field}: " for field in TEMPLATE_FIELDS]
+    return "\n".join(lines) + "\n"
+
+
+def parse_template(text: str) -> Dict[str, Dict[str, str]]:
+    """Parse an edited template back into {responder: {field: value}}."""
+    blocks = {}
+    current = None
+    field = None
+    
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('#'):
+            continue
+        if stripped.startswith('[') and stripped.endswith(']'):
+            current = blocks.setdefault(stripped[1:-1].strip(), {})
+            field = None
+            continue
+        if current is None:
+            continue
+        
+        key, sep, value = line.partition(':')
+        if sep and key.strip() in TEMPLATE_FIELDS:
+            field = key.strip()
+            current[field] = value.strip()
+        elif field == 'response_text' and stripped:
+            # Continuation line of a multi-line response
+            current[field] = f"{current[field]} {stripped}".strip()
+    
+    return blocks
+
+
+def build_response(query: pd.Series, responder: str, fields: Dict[str, str]) -> Dict:
+    """Validate one responder's raw fields into a response row."""
+    answered = fields.get('answered', '').lower()
+    if answered not in ANSWER_OPTIONS['answered']:
+        answered = 'partial'
+    
+    confidence = fields.get('confidence', '').lower()
+    if confidence not in ANSWER_OPTIONS['confidence']:
+        confidence = 'medium'
+    
+    source_cited = fields.get('source_cited', '').lower()
+    if not source_cited:
+        source_cited = 'none'
+    
+    try:
+        richness = int(fields.get('richness_score', ''))
+        richness = max(1, min(5, richness))
+    except ValueError:
+        richness = 3
+    
+    return {
+        'query_id': query['query_id'],
+        'responder': responder,
+        'response_text': fields['response_text'],
+        'answered': answered,
+        'confidence': confidence,
+        'source_cited': source_cited,
+        'richness_score': richness,
+        'collected_date': datetime.now().strftime('%Y-%m-%d')
+    }
+
+
+def prompt_query_responses(query: pd.Series) -> Tuple[List[Dict], bool]:
+    """
+    Prompt for each responder's answers with input().
+    
+    Returns:
+        (responses, quit) where quit is True if the user typed 'quit'
+    """
+    new_responses = []
+    for responder in RESPONDERS:
+        print(f"\n--- {responder.upper()} ---")
+        print("Test this query on the service, then enter the response.")
+        
+        response_text = input("Response text (or 'skip' to skip): ").strip()
+        if response_text.lower() == 'skip':
+            continue
+        if response_text.lower() == 'quit':
+            return new_responses, True
+        
+        fields = {
+            'response_text': response_text,
+            'answered': input("Answered? (yes/partial/no): ").strip(),
+            'confidence': input("Confidence? (high/medium/low): ").strip(),
+            'source_cited': input("Source cited? (e.g., yelp, google, none): ").strip(),
+            'richness_score': input("Richness score (1-5): ").strip(),
+        }
+        new_responses.append(build_response(query, responder, fields))
+    
+    return new_responses, False
+
+
+def edit_query_responses(query: pd.Series) -> Tuple[List[Dict], bool]:
+    """
+    Open the query template in the editor and return the entered responses.
+    
+    Falls back to prompting with input() if the editor cannot be started
+    or exits with an error.
+    
+    Returns:
+        (responses, quit) where quit is True if any response_text was 'quit'
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f"{query['query_id']}_", suffix=".txt")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(build_template(query))
+        editor = get_editor()
+        try:
+            result = subprocess.run(shlex.split(editor, posix=(os.name != 'nt')) + [tmp_name])
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not start editor '{editor}': {e}")
+            return prompt_query_responses(query)
+        if result.returncode != 0:
+            print(f"⚠️  Editor '{editor}' exited with status {result.returncode}")
+            return prompt_query_responses(query)
+        with open(tmp_name, 'r', encoding='utf-8') as f:
+            blocks = parse_template(f.read())
+    finally:
+        os.remove(tmp_name)
+    
+    new_responses = []
+    quit_session = False
+    for responder in RESPONDERS:
+        fields = blocks.get(responder, {})
+        response_text = fields.get('response_text', '')
+        if not response_text:
+            continue
+        if response_text.lower() == 'quit':
+            quit_session = True
+            continue
+        new_responses.append(build_response(query, responder, fields))
+    
+    return new_responses, quit_session
+
 
 def collect_responses(queries_file: str, output_file: str):
-    """Interactive response collection."""
+    """Interactive response collection, one editor session per query."""
     
     queries = load_queries(queries_file)
     output_path = PROJECT_ROOT / "data" / "responses" / output_file
@@ -39,7 +208,6 @@ def collect_responses(queries_file: str, output_file: str):
         collected_ids = set(existing['query_id'].unique())
         print(f"Found {len(collected_ids)} queries already collected.")
     else:
-        existing = pd.DataFrame()
         collected_ids = set()
     
     # Filter to uncollected queries
@@ -50,71 +218,29 @@ def collect_responses(queries_file: str, output_file: str):
         print("All queries have responses collected!")
         return
     
-    new_responses = []
-    
     for idx, query in remaining.iterrows():
         print("=" * 60)
         print(f"Query {query['query_id']}: {query['query_text']}")
-        if 'entity_name' in query and pd.notna(query['entity_name']):
-            print(f"Entity: {query['entity_name']}")
-        if 'location' in query and pd.notna(query['location']):
-            print(f"Location: {query['location']}")
         print("=" * 60)
+        print("Test this query on each service, then fill in the template in your editor.")
+        
+        new_responses, quit_session = edit_query_responses(query)
         
-        for responder in RESPONDERS:
-            print(f"\n--- {responder.upper()} ---")
-            print("Test this query on the service, then enter the response.")
-            
-            response_text = input("Response text (or 'skip' to skip): ").strip()
-            if response_text.lower() == 'skip':
-                continue
-            if response_text.lower() == 'quit':
-                print("Saving and quitting...")
-                break
-            
-            answered = input("Answered? (yes/partial/no): ").strip().lower()
-            if answered not in ANSWER_OPTIONS['answered']:
-                answered = 'partial'
-            
-            confidence = input("Confidence? (high/medium/low): ").strip().lower()
-            if confidence not in ANSWER_OPTIONS['confidence']:
-                confidence = 'medium'
-            
-            source_cited = input("Source cited? (e.g., yelp, google, none): ").strip().lower()
-            if not source_cited:
-                source_cited = 'none'
-            
-            richness = input("Richness score (1-5): ").strip()
-            try:
-                richness = int(richness)
-                richness = max(1, min(5, richness))
-            except:
-                richness = 3
-            
-            new_responses.append({
-                'query_id': query['query_id'],
-                'responder': responder,
-                'response_text': response_text,
-                'answered': answered,
-                'confidence': confidence,
-                'source_cited': source_cited,
-                'richness_score': richness,
-                'collected_date': datetime.now().strftime('%Y-%m-%d')
-            })
+        # Append after every query so an interrupted session loses nothing
+        if new_responses:
+            append_tsv(pd.DataFrame(new_responses), output_path)
+            print(f"\n✅ Saved {len(new_responses)} new responses to {output_path}")
+        else:
+            print("\nNo responses entered for this query.")
+        
+        if quit_session:
+            print("Saving and quitting...")
+            break
         
         # Check if user wants to continue
         cont = input("\nContinue to next query? (y/n): ").strip().lower()
         if cont != 'y':
             break
-    
-    # Save new responses
-    if new_responses:
-        new_df = pd.DataFrame(new_responses)
-        combined = pd.concat([existing, new_df], ignore_index=True)
-        save_tsv(combined, output_path)
-        print(f"\n✅ Saved {len(new_responses)} new responses to {output_path}")
-    else:
-        print("\nNo new responses collected.")
 
 
 def main():
@@ -4,6 +4,7 @@ Compare responses across different responders (Bing, Gemini, Perplexity, etc.)
 Usage:
     python compare_responses.py
     python compare_responses.py --queries my_queries.tsv --responses my_responses.tsv
+    python compare_responses.py --responses sample_responses_no_ties.tsv  # every query has one winner
 """
 
 import argparse
@@ -11,7 +12,7 @@ import pandas as pd
 from pathlib import Path
 from utils import (
     load_queries, load_responses, load_rubric, load_entities,
-    score_response, determine_winner, categorize_gap, save_tsv,
+    score_response, score_responses, categorize_gaps, save_tsv,
     PROJECT_ROOT
 )
 
@@ -19,11 +20,15 @@ from utils import (
 def compare_responses(
     queries_file: str = "sample_competitive_queries.tsv",
     responses_file: str = "sample_responses.tsv",
-    rubric_file: str = "competitive_rubric.tsv"
+    rubric_file: str = "competitive_rubric.tsv",
+    legacy_score: bool = False
 ) -> pd.DataFrame:
     """
     Compare responses and generate comparison report.
     
+    Args:
+        legacy_score: Score row by row with score_response (for verification)
+    
     Returns:
         DataFrame with comparison results
     """
@@ -35,40 +40,39 @@ def compare_responses(
     print(f"Loaded {len(queries)} queries, {len(responses)} responses")
     
     # Score each response
-    responses['score'] = responses.apply(lambda row: score_response(row, rubric), axis=1)
+    if legacy_score:
+        responses['score'] = responses.apply(lambda row: score_response(row, rubric), axis=1)
+    else:
+        responses['score'] = score_responses(responses, rubric)
     
     # Merge with queries
     merged = responses.merge(queries, on='query_id', how='left')
     
-    # Determine winner per query
-    winners = []
-    for query_id, group in merged.groupby('query_id'):
-        winner = determine_winner(group)
-        max_score = group['score'].max()
-        
-        # Get Bing's score
-        bing_rows = group[group['responder'] == 'bing_copilot']
-        bing_score = bing_rows['score'].iloc[0] if len(bing_rows) > 0 else None
-        bing_gap = max_score - bing_score if bing_score is not None else None
-        
-        # Categorize gap
-        bing_row = bing_rows.iloc[0] if len(bing_rows) > 0 else None
-        winner_row = group[group['score'] == max_score].iloc[0]
-        gap_reason = categorize_gap(bing_row, winner_row) if bing_row is not None else 'no_bing_response'
-        
-        winners.append({
-            'query_id': query_id,
-            'query_text': group['query_text'].iloc[0],
-            'query_type': group.get('query_type', pd.Series(['unknown'])).iloc[0],
-            'segment': group.get('segment', pd.Series(['unknown'])).iloc[0],
-            'winner': winner,
-            'winning_score': max_score,
-            'bing_score': bing_score,
-            'bing_gap': bing_gap,
-            'gap_reason': gap_reason
-        })
-    
-    results = pd.DataFrame(winners)
+    # Determine winner per query: every responder sharing the top score
+    max_score = merged.groupby('query_id')['score'].transform('max')
+    top = merged[merged['score'] == max_score]
+    # Plain strings: responder is categorical, and joining categories yields a Categorical
+    top_responders = top['responder'].astype(str).groupby(top['query_id']).agg(', '.join)
+    top_counts = top.groupby('query_id').size()
+    winner = top_responders.where(top_counts == 1, 'tie: ' + top_responders)
+    
+    # First row per query, first top-scoring row, and Bing's row
+    first_rows = merged.drop_duplicates('query_id').set_index('query_id').loc[winner.index]
+    winner_rows = top.drop_duplicates('query_id').set_index('query_id').loc[winner.index]
+    bing_rows = merged[merged['responder'] == 'bing_copilot'].drop_duplicates('query_id').set_index('query_id')
+    
+    bing_score = bing_rows['score'].reindex(winner.index)
+    
+    results = pd.DataFrame({
+        'query_text': first_rows['query_text'],
+        'query_type': first_rows['query_type'] if 'query_type' in first_rows else 'unknown',
+        'segment': first_rows['segment'] if 'segment' in first_rows else 'unknown',
+        'winner': winner,
+        'winning_score': winner_rows['score'],
+        'bing_score': bing_score,
+        'bing_gap': winner_rows['score'] - bing_score,
+        'gap_reason': categorize_gaps(bing_rows, winner_rows)
+    }).rename_axis('query_id').reset_index()
     
     # Print summary
     print("\n" + "="*60)
@@ -89,7 +93,7 @@ def compare_responses(
             print(f"  {reason}: {count}")
     
     print("\n📋 Results by Query Type:")
-    for qtype, group in results.groupby('query_type'):
+    for qtype, group in results.groupby('query_type', observed=True):
         bing_wins = (group['winner'] == 'bing_copilot').sum()
         total = len(group)
         print(f"  {qtype}: Bing wins {bing_wins}/{total} ({bing_wins/total*100:.0f}%)")
@@ -105,21 +109,33 @@ def main():
                         help='Responses TSV filename (in data/responses/)')
     parser.add_argument('--rubric', default='competitive_rubric.tsv',
                         help='Rubric TSV filename (in data/rubrics/)')
+    parser.add_argument('--legacy-score', action='store_true',
+                        help='Score responses row by row (slow; for verifying the vectorized scorer)')
+    parser.add_argument('--compress', action='store_true',
+                        help='Write the detailed results as comparison_detailed.tsv.gz')
     
     args = parser.parse_args()
     
-    results, detailed = compare_responses(args.queries, args.responses, args.rubric)
+    results, detailed = compare_responses(args.queries, args.responses, args.rubric,
+                                          legacy_score=args.legacy_score)
     
     # Save results
     output_dir = PROJECT_ROOT / "output"
     output_dir.mkdir(exist_ok=True)
     
-    save_tsv(results, output_dir / "comparison_summary.tsv")
-    save_tsv(detailed, output_dir / "comparison_detailed.tsv")
+    summary_path = output_dir / "comparison_summary.tsv"
+    detailed_path = output_dir / "comparison_detailed.tsv"
+    if args.compress:
+        # Drop any stale plain copy so readers pick up the .gz
+        detailed_path.unlink(missing_ok=True)
+        detailed_path = output_dir / "comparison_detailed.tsv.gz"
+    
+    save_tsv(results, summary_path)
+    save_tsv(detailed, detailed_path, compression='gzip' if args.compress else None)
     
     print(f"\n✅ Results saved to:")
-    print(f"   {output_dir / 'comparison_summary.tsv'}")
-    print(f"   {output_dir / 'comparison_detailed.tsv'}")
+    print(f"   {summary_path}")
+    print(f"   {detailed_path}")
 
 
 if __name__ == "__main__":
@@ -35,7 +35,9 @@ def generate_html_report():
     
     # Gap reasons
     losses = summary[summary['winner'] != 'bing_copilot']
-    gap_reasons = losses['gap_reason'].value_counts().to_dict() if len(losses) > 0 else {}
+    # gap_reason is categorical: drop categories only seen on Bing's wins (e.g. 'none')
+    gap_reasons = (losses['gap_reason'].cat.remove_unused_categories().value_counts().to_dict()
+                   if len(losses) > 0 else {})
     
     # By query type
     by_type = summary.groupby('query_type').apply(
@@ -2,34 +2,134 @@
 Utility functions for Grounding Playground
 """
 
+import hashlib
+import importlib.util
+import os
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict
 
 # Project root
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Parquet copies of input TSVs, rebuilt whenever the TSV changes
+CACHE_DIR = PROJECT_ROOT / "output" / ".cache"
+
+# Bump when load_tsv changes the dtypes it produces, to invalidate parquet copies
+PARQUET_CACHE_VERSION = 2
+
+# Use pyarrow's multithreaded CSV reader when it is installed
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
+# Low-cardinality label columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['responder', 'query_type', 'segment', 'method',
+                       'winner', 'gap_reason', 'source_cited']
+
+
+def resolve_tsv(filepath: str) -> Path:
+    """Return filepath, or its gzipped `<file>.gz` sibling if only that exists."""
+    filepath = Path(filepath)
+    gz_path = filepath.with_name(filepath.name + ".gz")
+    if not filepath.exists() and gz_path.exists():
+        return gz_path
+    return filepath
+
+
+def to_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the label columns of df (see CATEGORICAL_COLUMNS) to categoricals in place."""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
 
 def load_tsv(filepath: str) -> pd.DataFrame:
-    """Load a TSV file into a DataFrame."""
-    return pd.read_csv(filepath, sep='\t')
+    """Load a TSV file into a DataFrame, falling back to a gzipped `<file>.gz`."""
+    df = pd.read_csv(resolve_tsv(filepath), sep='\t', engine=CSV_ENGINE)
+    return to_categoricals(df)
+
+
+def save_tsv(df: pd.DataFrame, filepath: str, compression='infer'):
+    """Save a DataFrame to TSV (compression is passed through to to_csv)."""
+    df.to_csv(filepath, sep='\t', index=False, compression=compression)
+
+
+def append_tsv(df: pd.DataFrame, filepath: str):
+    """
+    Append rows to a TSV, writing the header only if the file is new.
+    
+    Columns are aligned to the existing file's header. Raises ValueError if
+    df has columns the file lacks, rather than silently dropping them.
+    """
+    filepath = Path(filepath)
+    if filepath.exists() and filepath.stat().st_size > 0:
+        header = pd.read_csv(filepath, sep='\t', nrows=0).columns
+        extra = df.columns.difference(header)
+        if len(extra) > 0:
+            raise ValueError(f"{filepath} has no columns {list(extra)}; not appending")
+        # Terminate the last line so the first new row doesn't join it
+        with open(filepath, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                f.write(os.linesep.encode())
+        df.reindex(columns=header).to_csv(filepath, sep='\t', index=False, mode='a', header=False)
+    else:
+        df.to_csv(filepath, sep='\t', index=False)
 
 
-def save_tsv(df: pd.DataFrame, filepath: str):
-    """Save a DataFrame to TSV."""
-    df.to_csv(filepath, sep='\t', index=False)
+def load_tsv_cached(filepath: str) -> pd.DataFrame:
+    """
+    Load a TSV through an in-process cache and a parquet cache in output/.cache/.
+    
+    Both are keyed on the TSV's path, exact mtime and size (the parquet cache
+    also on PARQUET_CACHE_VERSION), so edits and restores are picked up. The
+    parquet cache is skipped when no parquet engine (pyarrow) is installed.
+    Returns a copy, so callers may modify it freely.
+    """
+    filepath = resolve_tsv(filepath).resolve()
+    st = filepath.stat()
+    return _load_tsv_cached(str(filepath), st.st_mtime_ns, st.st_size).copy()
+
+
+@lru_cache(maxsize=None)
+def _load_tsv_cached(filepath: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    path_hash = hashlib.md5(filepath.encode('utf-8')).hexdigest()[:12]
+    key = f"{mtime_ns}:{size}:{PARQUET_CACHE_VERSION}"
+    key_hash = hashlib.md5(key.encode('utf-8')).hexdigest()[:12]
+    prefix = f"{Path(filepath).stem}-{path_hash}-"
+    cache_path = CACHE_DIR / f"{prefix}{key_hash}.parquet"
+    
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass  # No parquet engine or unreadable cache; fall back to the TSV
+    
+    df = load_tsv(filepath)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, compression='zstd')
+        # Drop copies of earlier versions of this TSV
+        for stale in CACHE_DIR.glob(f"{prefix}*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except Exception:
+        pass  # Caching is best-effort
+    return df
 
 
 def load_queries(filename: str = "sample_competitive_queries.tsv") -> pd.DataFrame:
     """Load queries from data/queries/"""
     filepath = PROJECT_ROOT / "data" / "queries" / filename
-    return load_tsv(filepath)
+    return load_tsv_cached(filepath)
 
 
 def load_responses(filename: str = "sample_responses.tsv") -> pd.DataFrame:
     """Load responses from data/responses/"""
     filepath = PROJECT_ROOT / "data" / "responses" / filename
-    return load_tsv(filepath)
+    return load_tsv_cached(filepath)
 
 
 def load_entities(filename: str = "sample_entities.tsv") -> pd.DataFrame:
@@ -41,7 +141,7 @@ def load_entities(filename: str = "sample_entities.tsv") -> pd.DataFrame:
 def load_rubric(filename: str = "competitive_rubric.tsv") -> pd.DataFrame:
     """Load rubric from data/rubrics/"""
     filepath = PROJECT_ROOT / "data" / "rubrics" / filename
-    return load_tsv(filepath)
+    return load_tsv_cached(filepath)
 
 
 def score_response(row: pd.Series, rubric: pd.DataFrame) -> float:
@@ -98,6 +198,47 @@ def score_response(row: pd.Series, rubric: pd.DataFrame) -> float:
     return total_score / total_weight if total_weight > 0 else 0.0
 
 
+def score_responses(responses: pd.DataFrame, rubric: pd.DataFrame) -> pd.Series:
+    """
+    Score all responses at once based on the rubric.
+    
+    Column-wise equivalent of applying score_response to every row.
+    
+    Args:
+        responses: Responses DataFrame with columns like 'answered', 'richness_score', etc.
+        rubric: The scoring rubric DataFrame
+    
+    Returns:
+        Series of weighted scores (0-1), aligned with responses.index
+    """
+    total_score = pd.Series(0.0, index=responses.index)
+    total_weight = 0.0
+    
+    for metric_name, weight in zip(rubric['metric_name'], rubric['weight']):
+        if metric_name not in responses.columns:
+            continue
+        
+        values = responses[metric_name]
+        
+        # Handle different metric types
+        if metric_name == 'answered':
+            score = values.map({'yes': 1.0, 'partial': 0.5}).fillna(0.0)
+        elif metric_name == 'confidence':
+            score = values.map({'high': 1.0, 'medium': 0.5}).fillna(0.0)
+        elif metric_name == 'source_cited':
+            cited = values.notna() & (values != 'none')
+            score = cited.astype(float) * 0.75  # Any source cited
+        elif metric_name == 'richness_score':
+            score = pd.to_numeric(values).astype(float).div(5.0).fillna(0.0)
+        else:
+            score = 0.5  # Default for unknown metrics
+        
+        total_score += score * weight
+        total_weight += weight
+    
+    return total_score / total_weight if total_weight > 0 else total_score
+
+
 def determine_winner(group: pd.DataFrame) -> str:
     """
     Determine winner for a query based on scores.
@@ -151,3 +292,33 @@ def categorize_gap(bing_row: Optional[pd.Series], winner_row: pd.Series) -> str:
         return 'no_source'
     
     return 'none'
+
+
+def categorize_gaps(bing_rows: pd.DataFrame, winner_rows: pd.DataFrame) -> pd.Series:
+    """
+    Categorize why Bing lost, for many queries at once.
+    
+    Column-wise equivalent of categorize_gap. Both frames are indexed by
+    query_id; queries missing from bing_rows get 'no_bing_response'.
+    """
+    bing = bing_rows.reindex(winner_rows.index)
+    
+    def col(df, name, default):
+        return df[name] if name in df.columns else pd.Series(default, index=df.index)
+    
+    bing_answered = col(bing, 'answered', 'no')
+    winner_answered = col(winner_rows, 'answered', 'no')
+    bing_source = col(bing, 'source_cited', 'none')
+    winner_source = col(winner_rows, 'source_cited', 'none')
+    
+    missing_data = (bing_answered == 'no') & winner_answered.isin(['yes', 'partial'])
+    less_rich = col(winner_rows, 'richness_score', 0) > col(bing, 'richness_score', 0)
+    no_source = ((bing_source == 'none') | bing_source.isna()) & (winner_source != 'none')
+    
+    reasons = np.select(
+        [missing_data, less_rich, no_source],
+        ['missing_data', 'less_rich', 'no_source'],
+        default='none'
+    )
+    reasons = np.where(winner_rows.index.isin(bing_rows.index), reasons, 'no_bing_response')
+    return pd.Series(reasons, index=winner_rows.index)
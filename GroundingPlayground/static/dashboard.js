@@ -0,0 +1,12 @@
+// Tab switching: one delegated listener on the tab bar
+document.addEventListener('DOMContentLoaded', () => {
+    const tabs = [...document.querySelectorAll('.tab')];
+    const panels = [...document.querySelectorAll('.tab-content')];
+
+    document.querySelector('.tabs').addEventListener('click', event => {
+        const tab = event.target.closest('.tab');
+        if (!tab) return;
+        tabs.forEach(el => el.classList.toggle('active', el === tab));
+        panels.forEach(el => el.classList.toggle('active', el.id === tab.dataset.tab));
+    });
+});